@@ -21,11 +21,21 @@ Example usage:
 from helix_sdk.client import HelixClient, HelixClientConfig
 from helix_sdk.encryption import (
     HelixEncryption,
+    StreamingDecryptor,
+    StreamingEncryptor,
     generate_key,
     encrypt_data,
+    encrypt_into,
     decrypt_data,
+    encrypt_many,
+    encrypt_stream,
+    decrypt_stream,
+    encrypt_stream_async,
+    decrypt_stream_async,
     export_key,
     import_key,
+    clear_cipher_cache,
+    clear_derived_key_cache,
 )
 
 __version__ = "0.1.0"
@@ -34,9 +44,19 @@ __all__ = [
     "HelixClient",
     "HelixClientConfig",
     "HelixEncryption",
+    "StreamingDecryptor",
+    "StreamingEncryptor",
     "generate_key",
     "encrypt_data",
+    "encrypt_into",
     "decrypt_data",
+    "encrypt_many",
+    "encrypt_stream",
+    "decrypt_stream",
+    "encrypt_stream_async",
+    "decrypt_stream_async",
     "export_key",
     "import_key",
+    "clear_cipher_cache",
+    "clear_derived_key_cache",
 ]
@@ -0,0 +1,32 @@
+"""
+JSON helpers for Helix
+
+Uses orjson when it is installed (``pip install helix-sdk[fast]``) and
+falls back to the standard library otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON, compact unless indent is set."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
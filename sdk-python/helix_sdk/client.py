@@ -9,20 +9,62 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
+import mimetypes
+import sys
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
+import aiofiles
 import httpx
 from nacl.signing import SigningKey, VerifyKey
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 
-from helix_sdk.encryption import HelixEncryption
+from helix_sdk._json import json_dumps, json_loads
+from helix_sdk.encryption import (
+    HelixEncryption,
+    StreamingDecryptor,
+    StreamingEncryptor,
+    encrypted_size,
+)
 
 
-@dataclass
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+ARWEAVE_GATEWAY_URL = "https://arweave.net"
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Required API fields, in FileRecord positional order
+_FILE_RECORD_FIELDS = itemgetter(
+    "id", "transactionId", "mimeType", "size", "isEncrypted", "createdAt"
+)
+
+# MIME types for common extensions, checked before the platform's
+# mimetypes database so these stay the same on every machine
+_MIME_TYPES = {
+    ".txt": "text/plain",
+    ".html": "text/html",
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".json": "application/json",
+    ".xml": "application/xml",
+    ".pdf": "application/pdf",
+    ".zip": "application/zip",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+    ".mp3": "audio/mpeg",
+    ".mp4": "video/mp4",
+    ".webm": "video/webm",
+}
+
+
+@dataclass(**_SLOTS)
 class HelixClientConfig:
     """Configuration for HelixClient"""
     
@@ -32,7 +74,7 @@ class HelixClientConfig:
     debug: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class FileRecord:
     """File record from the Helix API"""
     
@@ -46,7 +88,7 @@ class FileRecord:
     updated_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ShareLink:
     """Share link details"""
     
@@ -58,7 +100,7 @@ class ShareLink:
     max_downloads: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class UploadResult:
     """Result from file upload"""
     
@@ -96,10 +138,13 @@ class HelixClient:
             config: Client configuration options
         """
         self.keypair = keypair
+        self._wallet_address = str(keypair.pubkey())
         self.config = config or HelixClientConfig()
         self.encryption = HelixEncryption()
         self._auth_token: Optional[str] = None
+        self._headers: dict[str, str] = {"Content-Type": "application/json"}
         self._http_client: Optional[httpx.AsyncClient] = None
+        self._arweave_client: Optional[httpx.AsyncClient] = None
     
     @classmethod
     def from_keypair_file(
@@ -117,9 +162,7 @@ class HelixClient:
         Returns:
             Configured HelixClient instance
         """
-        path = Path(path).expanduser()
-        with open(path, "r") as f:
-            secret_key = json.load(f)
+        secret_key = json_loads(Path(path).expanduser().read_bytes())
         
         if isinstance(secret_key, list):
             keypair = Keypair.from_bytes(bytes(secret_key))
@@ -150,7 +193,7 @@ class HelixClient:
     @property
     def wallet_address(self) -> str:
         """Get the wallet address as a string."""
-        return str(self.keypair.pubkey())
+        return self._wallet_address
     
     @property
     def is_authenticated(self) -> bool:
@@ -163,15 +206,35 @@ class HelixClient:
             self._http_client = httpx.AsyncClient(
                 base_url=self.config.api_base_url,
                 timeout=self.config.timeout,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                ),
             )
         return self._http_client
     
-    def _get_headers(self) -> dict[str, str]:
-        """Build request headers."""
+    async def _get_arweave_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client for the Arweave gateway."""
+        if self._arweave_client is None or self._arweave_client.is_closed:
+            self._arweave_client = httpx.AsyncClient(
+                base_url=ARWEAVE_GATEWAY_URL,
+                timeout=self.config.timeout,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                ),
+            )
+        return self._arweave_client
+    
+    def _set_auth_token(self, token: Optional[str]) -> None:
+        """Store the auth token and rebuild the cached request headers."""
+        self._auth_token = token
         headers = {"Content-Type": "application/json"}
-        if self._auth_token:
-            headers["Authorization"] = f"Bearer {self._auth_token}"
-        return headers
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        self._headers = headers
     
     def _log(self, message: str) -> None:
         """Log a debug message."""
@@ -194,7 +257,7 @@ class HelixClient:
             f"/api/auth/nonce?wallet={self.wallet_address}"
         )
         response.raise_for_status()
-        nonce = response.json()["nonce"]
+        nonce = json_loads(response.content)["nonce"]
         self._log(f"Got nonce: {nonce}")
         
         message = f"Sign in to Helix: {nonce}"
@@ -206,15 +269,16 @@ class HelixClient:
         
         response = await client.post(
             "/api/auth/verify",
-            json={
+            content=json_dumps({
                 "wallet": self.wallet_address,
                 "signature": signature_b64,
                 "nonce": nonce,
-            },
+            }),
+            headers=self._headers,
         )
         response.raise_for_status()
         
-        self._auth_token = response.json()["token"]
+        self._set_auth_token(json_loads(response.content)["token"])
         self._log("Authentication successful")
         
         return self._auth_token
@@ -241,20 +305,17 @@ class HelixClient:
         response = await client.get(
             "/api/files",
             params={"page": page, "pageSize": page_size},
-            headers=self._get_headers(),
+            headers=self._headers,
         )
         response.raise_for_status()
         
-        data = response.json()
+        data = json_loads(response.content)
+        record = FileRecord
+        fields = _FILE_RECORD_FIELDS
         return [
-            FileRecord(
-                id=f["id"],
-                transaction_id=f["transactionId"],
+            record(
+                *fields(f),
                 encrypted_name=f.get("encryptedName"),
-                mime_type=f["mimeType"],
-                size=f["size"],
-                is_encrypted=f["isEncrypted"],
-                created_at=f["createdAt"],
                 updated_at=f.get("updatedAt"),
             )
             for f in data["files"]
@@ -276,19 +337,14 @@ class HelixClient:
         client = await self._get_client()
         response = await client.get(
             f"/api/files/{file_id}",
-            headers=self._get_headers(),
+            headers=self._headers,
         )
         response.raise_for_status()
         
-        f = response.json()
+        f = json_loads(response.content)
         return FileRecord(
-            id=f["id"],
-            transaction_id=f["transactionId"],
+            *_FILE_RECORD_FIELDS(f),
             encrypted_name=f.get("encryptedName"),
-            mime_type=f["mimeType"],
-            size=f["size"],
-            is_encrypted=f["isEncrypted"],
-            created_at=f["createdAt"],
             updated_at=f.get("updatedAt"),
         )
     
@@ -313,53 +369,48 @@ class HelixClient:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
         
         file_path = Path(file_path).expanduser()
-        
-        with open(file_path, "rb") as f:
-            data = f.read()
+        size = file_path.stat().st_size
         
         if mime_type is None:
             mime_type = self._guess_mime_type(file_path)
         
-        encryption_key: Optional[str] = None
+        key: Optional[bytes] = None
+        body = self._read_file_chunks(file_path)
         
         if encrypt:
             key = self.encryption.generate_key()
-            data = self.encryption.encrypt(data, key)
-            encryption_key = self.encryption.export_key(key)
-            self._log("File encrypted")
+            body = self._encrypt_chunks(body, StreamingEncryptor(key))
+            size = encrypted_size(size)
+            self._log("Encrypting file during upload")
         
-        transaction_id = await self._upload_to_arweave(data, mime_type)
+        transaction_id, encrypted_name = await asyncio.gather(
+            self._upload_to_arweave(body, mime_type, size=size),
+            self._encrypt_name(file_path.name, key),
+        )
         self._log(f"Uploaded to Arweave: {transaction_id}")
         
-        encrypted_name: Optional[str] = None
-        if encrypt and encryption_key:
-            key = self.encryption.import_key(encryption_key)
-            name_bytes = file_path.name.encode("utf-8")
-            encrypted_name_bytes = self.encryption.encrypt(name_bytes, key)
-            encrypted_name = base64.b64encode(encrypted_name_bytes).decode("utf-8")
-        
         client = await self._get_client()
         response = await client.post(
             "/api/files",
-            json={
+            content=json_dumps({
                 "transactionId": transaction_id,
                 "encryptedName": encrypted_name,
                 "mimeType": mime_type,
-                "size": len(data),
+                "size": size,
                 "isEncrypted": encrypt,
-            },
-            headers=self._get_headers(),
+            }),
+            headers=self._headers,
         )
         response.raise_for_status()
         
-        file_record = response.json()
+        file_record = json_loads(response.content)
         self._log("File record created")
         
         return UploadResult(
             transaction_id=transaction_id,
-            arweave_url=f"https://arweave.net/{transaction_id}",
+            arweave_url=f"{ARWEAVE_GATEWAY_URL}/{transaction_id}",
             file_id=file_record["id"],
-            encryption_key=encryption_key,
+            encryption_key=self.encryption.export_key(key) if key is not None else None,
         )
     
     async def upload_bytes(
@@ -384,47 +435,44 @@ class HelixClient:
         if not self.is_authenticated:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
         
-        encryption_key: Optional[str] = None
-        upload_data = data
+        key: Optional[bytes] = None
+        body: bytes | AsyncIterator[bytes] = data
+        size = len(data)
         
         if encrypt:
             key = self.encryption.generate_key()
-            upload_data = self.encryption.encrypt(data, key)
-            encryption_key = self.encryption.export_key(key)
-            self._log("Data encrypted")
+            body = self._encrypt_chunks(self._iter_chunks(data), StreamingEncryptor(key))
+            size = encrypted_size(size)
+            self._log("Encrypting data during upload")
         
-        transaction_id = await self._upload_to_arweave(upload_data, mime_type)
+        transaction_id, encrypted_name = await asyncio.gather(
+            self._upload_to_arweave(body, mime_type, size=size),
+            self._encrypt_name(filename, key),
+        )
         self._log(f"Uploaded to Arweave: {transaction_id}")
         
-        encrypted_name: Optional[str] = None
-        if encrypt and encryption_key:
-            key = self.encryption.import_key(encryption_key)
-            name_bytes = filename.encode("utf-8")
-            encrypted_name_bytes = self.encryption.encrypt(name_bytes, key)
-            encrypted_name = base64.b64encode(encrypted_name_bytes).decode("utf-8")
-        
         client = await self._get_client()
         response = await client.post(
             "/api/files",
-            json={
+            content=json_dumps({
                 "transactionId": transaction_id,
                 "encryptedName": encrypted_name,
                 "mimeType": mime_type,
-                "size": len(upload_data),
+                "size": size,
                 "isEncrypted": encrypt,
-            },
-            headers=self._get_headers(),
+            }),
+            headers=self._headers,
         )
         response.raise_for_status()
         
-        file_record = response.json()
+        file_record = json_loads(response.content)
         self._log("File record created")
         
         return UploadResult(
             transaction_id=transaction_id,
-            arweave_url=f"https://arweave.net/{transaction_id}",
+            arweave_url=f"{ARWEAVE_GATEWAY_URL}/{transaction_id}",
             file_id=file_record["id"],
-            encryption_key=encryption_key,
+            encryption_key=self.encryption.export_key(key) if key is not None else None,
         )
     
     async def download_file(
@@ -442,19 +490,25 @@ class HelixClient:
         Returns:
             Decrypted file data
         """
-        url = f"https://arweave.net/{transaction_id}"
+        client = await self._get_arweave_client()
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
+        decryptor: Optional[StreamingDecryptor] = None
+        if encryption_key:
+            decryptor = StreamingDecryptor(self.encryption.import_key(encryption_key))
+        
+        parts: list[bytes] = []
+        async with client.stream("GET", f"/{transaction_id}") as response:
             response.raise_for_status()
-            data = response.content
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                if decryptor is not None:
+                    chunk = await asyncio.to_thread(decryptor.update, chunk)
+                parts.append(chunk)
         
-        if encryption_key:
-            key = self.encryption.import_key(encryption_key)
-            data = self.encryption.decrypt(data, key)
+        if decryptor is not None:
+            parts.append(decryptor.finalize())
             self._log("File decrypted")
         
-        return data
+        return b"".join(parts)
     
     async def delete_file(self, file_id: str) -> None:
         """
@@ -469,7 +523,7 @@ class HelixClient:
         client = await self._get_client()
         response = await client.delete(
             f"/api/files/{file_id}",
-            headers=self._get_headers(),
+            headers=self._headers,
         )
         response.raise_for_status()
         self._log(f"File deleted: {file_id}")
@@ -499,17 +553,17 @@ class HelixClient:
         client = await self._get_client()
         response = await client.post(
             "/api/share",
-            json={
+            content=json_dumps({
                 "fileId": file_id,
                 "expiresAt": expires_at,
                 "maxDownloads": max_downloads,
                 "encryptedKey": encrypted_key,
-            },
-            headers=self._get_headers(),
+            }),
+            headers=self._headers,
         )
         response.raise_for_status()
         
-        data = response.json()["shareLink"]
+        data = json_loads(response.content)["shareLink"]
         return ShareLink(
             id=data["id"],
             url=data["url"],
@@ -519,55 +573,107 @@ class HelixClient:
             created_at=data["createdAt"] if "createdAt" in data else "",
         )
     
-    async def _upload_to_arweave(self, data: bytes, mime_type: str) -> str:
+    async def _read_file_chunks(self, path: Path) -> AsyncIterator[bytes]:
+        """Read a file in chunks without blocking the event loop."""
+        async with aiofiles.open(path, "rb") as f:
+            while True:
+                chunk = await f.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+    
+    async def _iter_chunks(self, data: bytes) -> AsyncIterator[bytes]:
+        """Split in-memory data into chunks without copying it."""
+        view = memoryview(data)
+        for offset in range(0, len(view), STREAM_CHUNK_SIZE):
+            yield view[offset:offset + STREAM_CHUNK_SIZE]
+    
+    async def _encrypt_chunks(
+        self,
+        chunks: AsyncIterator[bytes],
+        encryptor: StreamingEncryptor,
+    ) -> AsyncIterator[bytes]:
+        """
+        Encrypt a chunk stream on the fly.
+        
+        Chunks are encrypted in a worker thread and framed as
+        IV + ciphertext + auth tag.
+        """
+        yield encryptor.iv
+        async for chunk in chunks:
+            yield await asyncio.to_thread(encryptor.update, chunk)
+        yield encryptor.finalize()
+    
+    async def _encrypt_name(self, name: str, key: Optional[bytes]) -> Optional[str]:
+        """
+        Encrypt a filename for the file record.
+        
+        Runs in a worker thread so it can overlap with the upload.
+        Returns None when no key is given (unencrypted uploads).
+        """
+        if key is None:
+            return None
+        
+        encrypted = await asyncio.to_thread(
+            self.encryption.encrypt, name.encode("utf-8"), key
+        )
+        return base64.b64encode(encrypted).decode("utf-8")
+    
+    async def _upload_to_arweave(
+        self,
+        data: bytes | AsyncIterator[bytes],
+        mime_type: str,
+        size: Optional[int] = None,
+    ) -> str:
         """
         Upload data to Arweave via the Helix API.
         
         This is a simplified implementation that delegates to the server.
         For direct Irys integration, additional setup is required.
+        
+        Args:
+            data: Raw bytes, or an async iterator of chunks to stream
+            mime_type: MIME type of the uploaded content
+            size: Total body size, required to stream with a fixed length
         """
         client = await self._get_client()
         
+        headers = {
+            **self._headers,
+            "Content-Type": mime_type,
+        }
+        if size is not None:
+            headers["Content-Length"] = str(size)
+        
         response = await client.post(
             "/api/upload",
             content=data,
-            headers={
-                **self._get_headers(),
-                "Content-Type": mime_type,
-            },
+            headers=headers,
         )
         response.raise_for_status()
         
-        return response.json()["transactionId"]
+        return json_loads(response.content)["transactionId"]
     
     def _guess_mime_type(self, path: Path) -> str:
         """Guess MIME type from file extension."""
-        suffix = path.suffix.lower()
-        mime_types = {
-            ".txt": "text/plain",
-            ".html": "text/html",
-            ".css": "text/css",
-            ".js": "application/javascript",
-            ".json": "application/json",
-            ".xml": "application/xml",
-            ".pdf": "application/pdf",
-            ".zip": "application/zip",
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".svg": "image/svg+xml",
-            ".mp3": "audio/mpeg",
-            ".mp4": "video/mp4",
-            ".webm": "video/webm",
-        }
-        return mime_types.get(suffix, "application/octet-stream")
+        mime_type = _MIME_TYPES.get(path.suffix.lower())
+        if mime_type is not None:
+            return mime_type
+        
+        mime_type, encoding = mimetypes.guess_type(path.name)
+        # e.g. .tar.gz: the type describes the content, not the compressed file
+        if mime_type is None or encoding is not None:
+            return "application/octet-stream"
+        return mime_type
     
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP clients."""
         if self._http_client and not self._http_client.is_closed:
             await self._http_client.aclose()
             self._http_client = None
+        if self._arweave_client and not self._arweave_client.is_closed:
+            await self._arweave_client.aclose()
+            self._arweave_client = None
     
     async def __aenter__(self) -> HelixClient:
         """Async context manager entry."""
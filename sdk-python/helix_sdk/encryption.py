@@ -8,16 +8,300 @@ compatible with the TypeScript SDK.
 from __future__ import annotations
 
 import os
-import base64
-from typing import Tuple
+import asyncio
+import atexit
+import binascii
+import functools
+import hashlib
+import hmac
+import logging
+import platform
+import queue
+import struct
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Tuple
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+import cryptography
+from argon2.low_level import Type, hash_secret_raw
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.backends.openssl import backend as _openssl_backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, AESGCMSIV, ChaCha20Poly1305
+
+from helix_sdk._json import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
 
 
 IV_LENGTH = 12
 KEY_LENGTH = 32
 TAG_LENGTH = 16
 
+# Envelope header for the tagged (non-compat) format: version + algorithm tag
+ENVELOPE_VERSION = 0x01
+ENVELOPE_HEADER_LENGTH = 2
+
+ALG_AES_256_GCM = 0x01
+ALG_CHACHA20_POLY1305 = 0x02
+ALG_AES_256_GCM_SIV = 0x03
+
+# KDF tags for salt envelopes
+KDF_PBKDF2_SHA256 = 0x01
+KDF_ARGON2ID = 0x02
+
+PBKDF2_ITERATIONS = 100000
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST = 64 * 1024
+ARGON2_PARALLELISM = 4
+
+STREAM_SEGMENT_SIZE = 256 * 1024
+STREAM_PREFIX_LENGTH = 8
+
+_STREAM_RECORD_LENGTH = struct.Struct(">I")
+_STREAM_SEGMENT_MORE = b"\x00"
+_STREAM_SEGMENT_LAST = b"\x01"
+
+
+# Cipher instances cached per (cipher class, key), most recently used last
+_CIPHER_CACHE_SIZE = 128
+_ciphers: OrderedDict[tuple, object] = OrderedDict()
+_ciphers_lock = threading.Lock()
+
+
+def _get_cached_cipher(cipher_class: type, key: bytes):
+    """Get a cached cipher instance so the key schedule is computed once per key."""
+    cache_key = (cipher_class, key)
+    with _ciphers_lock:
+        cipher = _ciphers.get(cache_key)
+        if cipher is not None:
+            _ciphers.move_to_end(cache_key)
+            return cipher
+    
+    cipher = cipher_class(key)
+    with _ciphers_lock:
+        _ciphers[cache_key] = cipher
+        if len(_ciphers) > _CIPHER_CACHE_SIZE:
+            _ciphers.popitem(last=False)
+    return cipher
+
+
+def _evict_cached_ciphers(key: bytes) -> None:
+    """Drop every cached cipher built from a key."""
+    key = bytes(key)
+    with _ciphers_lock:
+        for cipher_class in (AESGCM, ChaCha20Poly1305, AESGCMSIV):
+            _ciphers.pop((cipher_class, key), None)
+
+
+def clear_cipher_cache() -> None:
+    """Drop all cached cipher instances and the key copies they hold."""
+    with _ciphers_lock:
+        _ciphers.clear()
+
+
+def _get_aesgcm(key: bytes) -> AESGCM:
+    """Get a cached AESGCM instance for a key."""
+    return _get_cached_cipher(AESGCM, key)
+
+
+def _get_chacha20poly1305(key: bytes) -> ChaCha20Poly1305:
+    """Get a cached ChaCha20Poly1305 instance for a key."""
+    return _get_cached_cipher(ChaCha20Poly1305, key)
+
+
+class _IvSource:
+    """
+    Userspace CSPRNG for IVs.
+    
+    Hands out 12-byte slices of a ChaCha20 keystream keyed from
+    os.urandom, so encrypting a message doesn't cost a getrandom()
+    syscall. IVs are pre-split into a list whose pop() is atomic, keeping
+    the hot path lock-free. The key is replaced after every 1 MiB of
+    output and in forked children, so parent and child never hand out
+    the same IVs.
+    """
+    
+    BUFFER_SIZE = 4092
+    REKEY_AFTER = 1 << 20
+    
+    def __init__(self):
+        self._reset()
+    
+    def _reset(self) -> None:
+        """Drop buffered IVs and start a fresh keystream."""
+        self._lock = threading.Lock()
+        self._ivs: list[bytes] = []
+        self._reseed()
+    
+    def _reseed(self) -> None:
+        """Start a new keystream under a fresh random key."""
+        cipher = Cipher(algorithms.ChaCha20(os.urandom(32), bytes(16)), mode=None)
+        self._keystream = cipher.encryptor()
+        self._produced = 0
+    
+    def _refill(self) -> None:
+        """Generate the next block of IVs."""
+        with self._lock:
+            if self._produced >= self.REKEY_AFTER:
+                self._reseed()
+            block = self._keystream.update(bytes(self.BUFFER_SIZE))
+            self._produced += self.BUFFER_SIZE
+            self._ivs.extend(
+                [block[i:i + IV_LENGTH] for i in range(0, self.BUFFER_SIZE, IV_LENGTH)]
+            )
+    
+    def next_iv(self) -> bytes:
+        """Get a fresh random 12-byte IV."""
+        while True:
+            try:
+                return self._ivs.pop()
+            except IndexError:
+                self._refill()
+
+
+_iv_source = _IvSource()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_iv_source._reset)
+
+
+def _get_aesgcmsiv(key: bytes) -> AESGCMSIV:
+    """Get a cached AESGCMSIV instance for a key."""
+    return _get_cached_cipher(AESGCMSIV, key)
+
+
+_AEADS = {
+    ALG_AES_256_GCM: _get_aesgcm,
+    ALG_CHACHA20_POLY1305: _get_chacha20poly1305,
+    ALG_AES_256_GCM_SIV: _get_aesgcmsiv,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def has_aes_acceleration() -> bool:
+    """
+    Check whether the CPU has hardware AES and carry-less multiplication.
+    
+    Without them AES-GCM falls back to a much slower software
+    implementation. The probe is best effort: if the platform cannot be
+    inspected, acceleration is assumed.
+    
+    Returns:
+        True if AES-GCM is expected to run in hardware
+    """
+    system = platform.system()
+    
+    if system == "Linux":
+        try:
+            with open("/proc/cpuinfo", "r") as f:
+                for line in f:
+                    name, _, value = line.partition(":")
+                    if name.strip() in ("flags", "Features"):
+                        flags = set(value.split())
+                        # x86: aes + pclmulqdq, ARMv8: aes + pmull
+                        return "aes" in flags and bool(flags & {"pclmulqdq", "pmull"})
+        except OSError:
+            pass
+        return True
+    
+    if system == "Darwin":
+        if platform.machine() == "arm64":
+            return True
+        try:
+            result = subprocess.run(
+                ["sysctl", "-n", "hw.optional.aes"],
+                capture_output=True,
+                text=True,
+                timeout=2,
+            )
+            return result.stdout.strip() == "1"
+        except (OSError, subprocess.SubprocessError):
+            return True
+    
+    return True
+
+
+def preferred_algorithm() -> int:
+    """Get the algorithm tag best suited to this CPU."""
+    return ALG_AES_256_GCM if has_aes_acceleration() else ALG_CHACHA20_POLY1305
+
+
+def backend_info() -> dict:
+    """
+    Describe the crypto backend doing the actual work.
+    
+    OpenSSL picks its AES-GCM kernel (AES-NI, or VAES/VPCLMULQDQ on
+    newer x86 CPUs) at runtime, so throughput depends on the OpenSSL
+    bundled with the installed cryptography wheel rather than on this
+    package. Useful when comparing performance across machines.
+    
+    Returns:
+        Dict with cryptography version, OpenSSL version and AES acceleration
+    """
+    return {
+        "cryptography": cryptography.__version__,
+        "openssl": _openssl_backend.openssl_version_text(),
+        "aes_acceleration": has_aes_acceleration(),
+    }
+
+
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("Crypto backend: %s", backend_info())
+
+
+def _encrypt_tagged(algorithm: int, data: bytes, key: bytes) -> bytes:
+    """Encrypt into version + algorithm tag + IV + ciphertext + auth tag."""
+    iv = _iv_source.next_iv()
+    header = bytes((ENVELOPE_VERSION, algorithm)) + iv
+    return header + _AEADS[algorithm](bytes(key)).encrypt(iv, data, None)
+
+
+def _decrypt_tagged(encrypted_data: bytes, key: bytes) -> bytes:
+    """Decrypt version + algorithm tag + IV + ciphertext + auth tag."""
+    if len(encrypted_data) < ENVELOPE_HEADER_LENGTH + IV_LENGTH + TAG_LENGTH:
+        raise ValueError("Encrypted data too short")
+    
+    view = memoryview(encrypted_data)
+    version, algorithm = view[0], view[1]
+    if version != ENVELOPE_VERSION:
+        raise ValueError(f"Unsupported envelope version: {version:#04x}")
+    
+    get_aead = _AEADS.get(algorithm)
+    if get_aead is None:
+        raise ValueError(f"Unknown algorithm tag: {algorithm:#04x}")
+    
+    iv = bytes(view[ENVELOPE_HEADER_LENGTH:ENVELOPE_HEADER_LENGTH + IV_LENGTH])
+    ciphertext = view[ENVELOPE_HEADER_LENGTH + IV_LENGTH:]
+    return get_aead(bytes(key)).decrypt(iv, ciphertext, None)
+
+
+def _decrypt_untagged(encrypted_data: bytes, key: bytes) -> bytes:
+    """Decrypt the TypeScript SDK's IV + ciphertext + auth tag format."""
+    if len(encrypted_data) < IV_LENGTH + TAG_LENGTH:
+        raise ValueError("Encrypted data too short")
+    
+    view = memoryview(encrypted_data)
+    iv = bytes(view[:IV_LENGTH])
+    ciphertext = view[IV_LENGTH:]
+    return _get_aesgcm(bytes(key)).decrypt(iv, ciphertext, None)
+
+
+def _decrypt_envelope(encrypted_data: bytes, key: bytes) -> bytes:
+    """
+    Decrypt the tagged format, falling back to the untagged one.
+    
+    Untagged data has a random IV in front, so it can happen to start
+    with a valid header; anything that fails to open as an envelope is
+    retried as plain AES-256-GCM before giving up.
+    """
+    try:
+        return _decrypt_tagged(encrypted_data, key)
+    except (InvalidTag, ValueError):
+        return _decrypt_untagged(encrypted_data, key)
+
 
 class HelixEncryption:
     """
@@ -25,6 +309,13 @@ class HelixEncryption:
     
     Compatible with Web Crypto API used in the TypeScript SDK.
     
+    ``algorithm="aes-gcm-siv"`` selects nonce-misuse-resistant
+    AES-256-GCM-SIV instead: an accidentally repeated IV then only
+    reveals whether two messages are identical, rather than breaking
+    confidentiality and authenticity. Its output uses the versioned
+    envelope format (see ``encrypt_data(..., compat=False)``) and is not
+    readable by the TypeScript SDK.
+    
     Example:
         >>> enc = HelixEncryption()
         >>> key = enc.generate_key()
@@ -32,6 +323,38 @@ class HelixEncryption:
         >>> decrypted = enc.decrypt(encrypted, key)
     """
     
+    ALGORITHMS = {
+        "aes-gcm": None,
+        "aes-gcm-siv": ALG_AES_256_GCM_SIV,
+    }
+    
+    def __init__(self, algorithm: str = "aes-gcm"):
+        """
+        Initialize the encryption utilities.
+        
+        Args:
+            algorithm: "aes-gcm" (TypeScript SDK compatible) or "aes-gcm-siv"
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unsupported algorithm: {algorithm}")
+        
+        self.algorithm = algorithm
+        self._algorithm_tag = self.ALGORITHMS[algorithm]
+        self._cipher: Optional[Tuple[bytes, AESGCM]] = None
+    
+    def _get_cipher(self, key: bytes) -> AESGCM:
+        """Get the AESGCM instance for a key, short-circuiting repeat keys."""
+        cached = self._cipher
+        # Identity, not ==, so secret key bytes are never compared in
+        # variable time. bytes(key) keeps a bytes key as the same object.
+        if cached is not None and cached[0] is key:
+            return cached[1]
+        
+        key = bytes(key)
+        aesgcm = _get_aesgcm(key)
+        self._cipher = (key, aesgcm)
+        return aesgcm
+    
     def generate_key(self) -> bytes:
         """
         Generate a new random 256-bit encryption key.
@@ -58,11 +381,11 @@ class HelixEncryption:
         if len(key) != KEY_LENGTH:
             raise ValueError(f"Key must be {KEY_LENGTH} bytes")
         
-        iv = os.urandom(IV_LENGTH)
-        aesgcm = AESGCM(key)
-        ciphertext = aesgcm.encrypt(iv, data, None)
+        if self._algorithm_tag is not None:
+            return _encrypt_tagged(self._algorithm_tag, data, key)
         
-        return iv + ciphertext
+        iv = _iv_source.next_iv()
+        return iv + self._get_cipher(key).encrypt(iv, data, None)
     
     def decrypt(self, encrypted_data: bytes, key: bytes) -> bytes:
         """
@@ -80,13 +403,17 @@ class HelixEncryption:
         if len(key) != KEY_LENGTH:
             raise ValueError(f"Key must be {KEY_LENGTH} bytes")
         
+        if self._algorithm_tag is not None:
+            return _decrypt_envelope(encrypted_data, key)
+        
         if len(encrypted_data) < IV_LENGTH + TAG_LENGTH:
             raise ValueError("Encrypted data too short")
         
-        iv = encrypted_data[:IV_LENGTH]
-        ciphertext = encrypted_data[IV_LENGTH:]
+        view = memoryview(encrypted_data)
+        iv = bytes(view[:IV_LENGTH])
+        ciphertext = view[IV_LENGTH:]
         
-        aesgcm = AESGCM(key)
+        aesgcm = self._get_cipher(key)
         return aesgcm.decrypt(iv, ciphertext, None)
     
     def export_key(self, key: bytes) -> str:
@@ -99,7 +426,7 @@ class HelixEncryption:
         Returns:
             Base64 encoded key
         """
-        return base64.b64encode(key).decode("utf-8")
+        return export_key(key)
     
     def import_key(self, key_string: str) -> bytes:
         """
@@ -111,10 +438,7 @@ class HelixEncryption:
         Returns:
             Raw key bytes
         """
-        key = base64.b64decode(key_string)
-        if len(key) != KEY_LENGTH:
-            raise ValueError(f"Invalid key length: expected {KEY_LENGTH} bytes")
-        return key
+        return import_key(key_string)
     
     def encrypt_string(self, text: str, key: bytes) -> str:
         """
@@ -127,9 +451,8 @@ class HelixEncryption:
         Returns:
             Base64 encoded encrypted data
         """
-        data = text.encode("utf-8")
-        encrypted = self.encrypt(data, key)
-        return base64.b64encode(encrypted).decode("utf-8")
+        encrypted = self.encrypt(text.encode("utf-8"), key)
+        return binascii.b2a_base64(encrypted, newline=False).decode("ascii")
     
     def decrypt_string(self, encrypted_b64: str, key: bytes) -> str:
         """
@@ -142,9 +465,148 @@ class HelixEncryption:
         Returns:
             Decrypted string
         """
-        encrypted = base64.b64decode(encrypted_b64)
-        decrypted = self.decrypt(encrypted, key)
-        return decrypted.decode("utf-8")
+        encrypted = binascii.a2b_base64(encrypted_b64)
+        return self.decrypt(encrypted, key).decode("utf-8")
+
+
+class StreamingEncryptor:
+    """
+    Incremental AES-256-GCM encryptor for large payloads.
+    
+    Produces exactly the same IV + ciphertext + auth tag layout as
+    ``HelixEncryption.encrypt``, but consumes the plaintext chunk by chunk
+    so the full file never has to be held in memory.
+    
+    Example:
+        >>> encryptor = StreamingEncryptor(key)
+        >>> parts = [encryptor.iv]
+        >>> parts.extend(encryptor.update(chunk) for chunk in chunks)
+        >>> parts.append(encryptor.finalize())
+    """
+    
+    def __init__(self, key: bytes):
+        """
+        Initialize the encryptor with a fresh random IV.
+        
+        Args:
+            key: 32-byte encryption key
+        """
+        if len(key) != KEY_LENGTH:
+            raise ValueError(f"Key must be {KEY_LENGTH} bytes")
+        
+        self.iv = _iv_source.next_iv()
+        self._encryptor = Cipher(algorithms.AES(key), modes.GCM(self.iv)).encryptor()
+    
+    def update(self, data: bytes) -> bytes:
+        """
+        Encrypt the next chunk of plaintext.
+        
+        Args:
+            data: Plaintext chunk
+            
+        Returns:
+            Ciphertext for the chunk
+        """
+        return self._encryptor.update(data)
+    
+    def finalize(self) -> bytes:
+        """
+        Finish encryption.
+        
+        Returns:
+            Remaining ciphertext followed by the 16-byte auth tag
+        """
+        tail = self._encryptor.finalize()
+        return tail + self._encryptor.tag
+
+
+class StreamingDecryptor:
+    """
+    Incremental AES-256-GCM decryptor for large payloads.
+    
+    Accepts IV + ciphertext + auth tag data in arbitrarily sized chunks,
+    holding back the trailing bytes until the auth tag can be verified.
+    Plaintext returned by ``update`` is unauthenticated until ``finalize``
+    succeeds and must not be used before then.
+    
+    Example:
+        >>> decryptor = StreamingDecryptor(key)
+        >>> parts = [decryptor.update(chunk) for chunk in chunks]
+        >>> decryptor.finalize()
+        >>> plaintext = b"".join(parts)
+    """
+    
+    def __init__(self, key: bytes):
+        """
+        Initialize the decryptor.
+        
+        Args:
+            key: 32-byte decryption key
+        """
+        if len(key) != KEY_LENGTH:
+            raise ValueError(f"Key must be {KEY_LENGTH} bytes")
+        
+        self._key = key
+        self._decryptor = None
+        self._pending = b""
+    
+    def update(self, data: bytes) -> bytes:
+        """
+        Decrypt the next chunk of encrypted data.
+        
+        Args:
+            data: Next chunk of IV + ciphertext + auth tag
+            
+        Returns:
+            Plaintext for the ciphertext consumed so far
+        """
+        view = memoryview(data)
+        
+        if self._decryptor is None:
+            needed = IV_LENGTH - len(self._pending)
+            if len(view) < needed:
+                self._pending += bytes(view)
+                return b""
+            iv = self._pending + bytes(view[:needed])
+            view = view[needed:]
+            self._pending = b""
+            self._decryptor = Cipher(algorithms.AES(self._key), modes.GCM(iv)).decryptor()
+        
+        # Short chunks are merged with the held-back tail; both are tiny
+        if len(view) < TAG_LENGTH:
+            buffered = self._pending + bytes(view)
+            if len(buffered) <= TAG_LENGTH:
+                self._pending = buffered
+                return b""
+            self._pending = buffered[-TAG_LENGTH:]
+            return self._decryptor.update(buffered[:-TAG_LENGTH])
+        
+        # The held-back tail wasn't the tag after all; the new one might be
+        head = self._decryptor.update(self._pending) if self._pending else b""
+        self._pending = bytes(view[-TAG_LENGTH:])
+        body = self._decryptor.update(view[:-TAG_LENGTH])
+        return head + body if head else body
+    
+    def finalize(self) -> bytes:
+        """
+        Verify the auth tag and finish decryption.
+        
+        Returns:
+            Remaining plaintext
+            
+        Raises:
+            ValueError: If the data was too short to contain an IV and tag
+            cryptography.exceptions.InvalidTag: If authentication fails
+        """
+        if self._decryptor is None or len(self._pending) < TAG_LENGTH:
+            raise ValueError("Encrypted data too short")
+        
+        return self._decryptor.finalize_with_tag(self._pending)
+
+
+def encrypted_size(plaintext_size: int) -> int:
+    """Size of the IV + ciphertext + auth tag output for a plaintext size."""
+    return IV_LENGTH + plaintext_size + TAG_LENGTH
 
 
 def generate_key() -> bytes:
@@ -152,34 +614,90 @@ def generate_key() -> bytes:
     return os.urandom(KEY_LENGTH)
 
 
-def encrypt_data(data: bytes, key: bytes) -> bytes:
+def encrypt_data(data: bytes, key: bytes, compat: bool = True) -> bytes:
     """
     Encrypt data with AES-256-GCM.
     
+    With ``compat=False`` the output is prefixed with a two-byte header
+    (envelope version, algorithm tag), and ChaCha20-Poly1305 is used
+    instead of AES-256-GCM on CPUs without hardware AES. The tagged
+    format is not readable by the TypeScript SDK.
+    
     Args:
         data: Data to encrypt
         key: 32-byte encryption key
+        compat: Produce the untagged AES-256-GCM format
         
     Returns:
-        IV + ciphertext + auth tag
+        IV + ciphertext + auth tag (prefixed with the envelope header
+        when ``compat`` is False)
     """
     if len(key) != KEY_LENGTH:
         raise ValueError(f"Key must be {KEY_LENGTH} bytes")
     
-    iv = os.urandom(IV_LENGTH)
-    aesgcm = AESGCM(key)
-    ciphertext = aesgcm.encrypt(iv, data, None)
+    if not compat:
+        return _encrypt_tagged(preferred_algorithm(), data, key)
     
-    return iv + ciphertext
+    iv = _iv_source.next_iv()
+    return iv + _get_aesgcm(bytes(key)).encrypt(iv, data, None)
 
 
-def decrypt_data(encrypted_data: bytes, key: bytes) -> bytes:
+def encrypt_into(data: bytes, key: bytes, out: bytearray | memoryview) -> int:
+    """
+    Encrypt data with AES-256-GCM straight into a caller-provided buffer.
+    
+    Writes the same IV + ciphertext + auth tag as ``encrypt_data``, but
+    without allocating the result, which saves a full-size copy for large
+    payloads. ``out`` must hold at least ``encrypted_size(len(data))``
+    bytes.
+    
+    Args:
+        data: Data to encrypt
+        key: 32-byte encryption key
+        out: Writable buffer to encrypt into
+        
+    Returns:
+        Number of bytes written
+    """
+    if len(key) != KEY_LENGTH:
+        raise ValueError(f"Key must be {KEY_LENGTH} bytes")
+    
+    size = encrypted_size(len(data))
+    if len(out) < size:
+        raise ValueError(f"Output buffer must be at least {size} bytes")
+    
+    iv = _iv_source.next_iv()
+    aesgcm = _get_aesgcm(bytes(key))
+    
+    with memoryview(out) as view:
+        view[:IV_LENGTH] = iv
+        
+        if hasattr(aesgcm, "encrypt_into"):
+            # Newer cryptography releases reuse the cached key schedule
+            aesgcm.encrypt_into(iv, data, None, view[IV_LENGTH:size])
+            return size
+        
+        encryptor = Cipher(algorithms.AES(bytes(key)), modes.GCM(iv)).encryptor()
+        # The tag space doubles as the block of slack update_into requires
+        end = IV_LENGTH + encryptor.update_into(data, view[IV_LENGTH:size])
+        encryptor.finalize()
+        view[end:size] = encryptor.tag
+    
+    return size
+
+
+def decrypt_data(encrypted_data: bytes, key: bytes, compat: bool = True) -> bytes:
     """
     Decrypt data encrypted with AES-256-GCM.
     
+    With ``compat=False`` the cipher is selected from the envelope header
+    written by ``encrypt_data(..., compat=False)``. Data without a
+    header, as produced by the TypeScript SDK, is still accepted.
+    
     Args:
         encrypted_data: IV + ciphertext + auth tag
         key: 32-byte decryption key
+        compat: Expect the untagged AES-256-GCM format
         
     Returns:
         Decrypted data
@@ -187,56 +705,547 @@ def decrypt_data(encrypted_data: bytes, key: bytes) -> bytes:
     if len(key) != KEY_LENGTH:
         raise ValueError(f"Key must be {KEY_LENGTH} bytes")
     
-    if len(encrypted_data) < IV_LENGTH + TAG_LENGTH:
-        raise ValueError("Encrypted data too short")
+    if not compat:
+        return _decrypt_envelope(encrypted_data, key)
     
-    iv = encrypted_data[:IV_LENGTH]
-    ciphertext = encrypted_data[IV_LENGTH:]
+    return _decrypt_untagged(encrypted_data, key)
+
+
+def encrypt_many(data_list: Iterable[bytes], key: bytes) -> list[bytes]:
+    """
+    Encrypt many chunks under one key with AES-256-GCM.
+    
+    Produces the same output as calling ``encrypt_data`` on each chunk,
+    but validates the key and looks up its cached cipher once for the
+    whole batch, and keeps the per-chunk loop free of Python-level
+    dispatch beyond the IV pop and the AES-GCM call itself.
+    
+    Args:
+        data_list: Chunks to encrypt
+        key: 32-byte encryption key
+        
+    Returns:
+        IV + ciphertext + auth tag for each chunk, in input order
+    """
+    if len(key) != KEY_LENGTH:
+        raise ValueError(f"Key must be {KEY_LENGTH} bytes")
+    
+    seal = _get_aesgcm(bytes(key)).encrypt
+    next_iv = _iv_source.next_iv
+    
+    out = []
+    for data in data_list:
+        iv = next_iv()
+        out.append(iv + seal(iv, data, None))
+    return out
+
+
+class _StreamSealer:
+    """Encrypts the segments of one stream under consecutive nonces."""
+    
+    def __init__(self, key: bytes):
+        if len(key) != KEY_LENGTH:
+            raise ValueError(f"Key must be {KEY_LENGTH} bytes")
+        
+        self.prefix = _iv_source.next_iv()[:STREAM_PREFIX_LENGTH]
+        self._aesgcm = _get_aesgcm(bytes(key))
+        self._counter = 0
+    
+    def seal(self, segment: bytes, last: bool) -> bytes:
+        """Encrypt a segment into a length-prefixed record."""
+        nonce = _stream_nonce(self.prefix, self._counter)
+        self._counter += 1
+        aad = _STREAM_SEGMENT_LAST if last else _STREAM_SEGMENT_MORE
+        ciphertext = self._aesgcm.encrypt(nonce, segment, aad)
+        return _STREAM_RECORD_LENGTH.pack(len(ciphertext)) + ciphertext
+
+
+class _StreamOpener:
+    """Decrypts the records of one stream, enforcing their order."""
+    
+    def __init__(self, key: bytes, prefix: bytes):
+        self.prefix = prefix
+        self._aesgcm = _get_aesgcm(bytes(key))
+        self._counter = 0
+    
+    def open(self, ciphertext: bytes, last: bool) -> bytes:
+        """Decrypt and authenticate the next record's ciphertext."""
+        nonce = _stream_nonce(self.prefix, self._counter)
+        self._counter += 1
+        aad = _STREAM_SEGMENT_LAST if last else _STREAM_SEGMENT_MORE
+        return self._aesgcm.decrypt(nonce, ciphertext, aad)
+
+
+def _stream_nonce(prefix: bytes, counter: int) -> bytes:
+    """Build the nonce for a segment: prefix (8 bytes) + counter (4 bytes BE)."""
+    if counter > 0xFFFFFFFF:
+        raise ValueError("Stream exceeds the maximum number of segments")
+    return prefix + counter.to_bytes(4, "big")
+
+
+def _check_stream_args(key: bytes, segment_size: int = STREAM_SEGMENT_SIZE) -> None:
+    """Validate stream arguments up front, before any chunk is consumed."""
+    if len(key) != KEY_LENGTH:
+        raise ValueError(f"Key must be {KEY_LENGTH} bytes")
+    if segment_size <= 0:
+        raise ValueError("Segment size must be positive")
+
+
+def _split_record(
+    pending: bytearray,
+    max_length: int,
+) -> Optional[Tuple[bytes, int]]:
+    """Split the next complete record off a buffer, if there is one."""
+    if len(pending) < _STREAM_RECORD_LENGTH.size:
+        return None
+    
+    (length,) = _STREAM_RECORD_LENGTH.unpack_from(pending)
+    # Reject forged lengths before buffering up to them
+    if length > max_length:
+        raise ValueError("Encrypted stream record exceeds the maximum segment size")
+    end = _STREAM_RECORD_LENGTH.size + length
+    if len(pending) < end:
+        return None
+    
+    return bytes(pending[_STREAM_RECORD_LENGTH.size:end]), end
+
+
+def encrypt_stream(
+    chunks: Iterable[bytes],
+    key: bytes,
+    segment_size: int = STREAM_SEGMENT_SIZE,
+) -> Iterator[bytes]:
+    """
+    Encrypt a stream of chunks as independently authenticated segments.
+    
+    The input is re-cut into segments of ``segment_size`` bytes, each
+    encrypted with AES-256-GCM under the nonce prefix + segment counter.
+    The final segment is bound as such, so truncated or reordered streams
+    fail to decrypt. Memory use is O(segment_size) regardless of the
+    total length, and the receiver can start decrypting immediately.
+    
+    Output format: prefix (8 bytes), then per segment
+    length (4 bytes BE) + ciphertext + auth tag.
+    
+    This format is not compatible with ``decrypt``/``decrypt_data``;
+    use ``decrypt_stream``.
+    
+    Args:
+        chunks: Plaintext chunks of any size
+        key: 32-byte encryption key
+        segment_size: Plaintext bytes per segment
+        
+    Yields:
+        Encrypted stream data
+    """
+    _check_stream_args(key, segment_size)
+    return _encrypt_stream(chunks, _StreamSealer(key), segment_size)
+
+
+def _encrypt_stream(
+    chunks: Iterable[bytes],
+    sealer: _StreamSealer,
+    segment_size: int,
+) -> Iterator[bytes]:
+    """Generator behind ``encrypt_stream``."""
+    yield sealer.prefix
+    
+    pending = bytearray()
+    for chunk in chunks:
+        pending += chunk
+        while len(pending) > segment_size:
+            yield sealer.seal(pending[:segment_size], last=False)
+            del pending[:segment_size]
+    
+    yield sealer.seal(pending, last=True)
+
+
+def decrypt_stream(
+    chunks: Iterable[bytes],
+    key: bytes,
+    max_segment_size: int = STREAM_SEGMENT_SIZE,
+) -> Iterator[bytes]:
+    """
+    Decrypt a stream produced by ``encrypt_stream``.
+    
+    Input may arrive in chunks of any size. Each segment is authenticated
+    before its plaintext is yielded. Records longer than
+    ``max_segment_size`` are rejected as soon as their length is read, so
+    a forged length can't make the decryptor buffer the whole stream.
+    
+    Args:
+        chunks: Encrypted stream data
+        key: 32-byte decryption key
+        max_segment_size: Largest plaintext segment to accept; must be at
+            least the ``segment_size`` the stream was encrypted with
+        
+    Yields:
+        Decrypted plaintext segments
+        
+    Raises:
+        ValueError: If the stream is truncated or malformed
+        cryptography.exceptions.InvalidTag: If authentication fails
+    """
+    _check_stream_args(key, max_segment_size)
+    return _decrypt_stream(chunks, key, max_segment_size + TAG_LENGTH)
+
+
+def _decrypt_stream(
+    chunks: Iterable[bytes],
+    key: bytes,
+    max_record_length: int,
+) -> Iterator[bytes]:
+    """Generator behind ``decrypt_stream``."""
+    opener: Optional[_StreamOpener] = None
+    pending = bytearray()
+    
+    for chunk in chunks:
+        pending += chunk
+        
+        if opener is None:
+            if len(pending) < STREAM_PREFIX_LENGTH:
+                continue
+            opener = _StreamOpener(key, bytes(pending[:STREAM_PREFIX_LENGTH]))
+            del pending[:STREAM_PREFIX_LENGTH]
+        
+        # A record is only known not to be the last once more data follows it
+        record = _split_record(pending, max_record_length)
+        while record is not None and record[1] < len(pending):
+            yield opener.open(record[0], last=False)
+            del pending[:record[1]]
+            record = _split_record(pending, max_record_length)
+    
+    record = None
+    if opener is not None:
+        record = _split_record(pending, max_record_length)
+    if record is None or record[1] != len(pending):
+        raise ValueError("Encrypted stream is truncated or malformed")
+    
+    yield opener.open(record[0], last=True)
+
+
+def encrypt_stream_async(
+    chunks: AsyncIterable[bytes],
+    key: bytes,
+    segment_size: int = STREAM_SEGMENT_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Async variant of ``encrypt_stream``.
+    
+    Segments are encrypted in a worker thread, so encryption overlaps
+    with the network I/O producing or consuming the chunks.
+    """
+    _check_stream_args(key, segment_size)
+    return _encrypt_stream_async(chunks, _StreamSealer(key), segment_size)
+
+
+async def _encrypt_stream_async(
+    chunks: AsyncIterable[bytes],
+    sealer: _StreamSealer,
+    segment_size: int,
+) -> AsyncIterator[bytes]:
+    """Async generator behind ``encrypt_stream_async``."""
+    yield sealer.prefix
+    
+    pending = bytearray()
+    async for chunk in chunks:
+        pending += chunk
+        while len(pending) > segment_size:
+            segment = pending[:segment_size]
+            del pending[:segment_size]
+            yield await asyncio.to_thread(sealer.seal, segment, False)
+    
+    yield await asyncio.to_thread(sealer.seal, pending, True)
+
+
+def decrypt_stream_async(
+    chunks: AsyncIterable[bytes],
+    key: bytes,
+    max_segment_size: int = STREAM_SEGMENT_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Async variant of ``decrypt_stream``.
+    
+    Segments are decrypted in a worker thread as soon as they arrive.
+    """
+    _check_stream_args(key, max_segment_size)
+    return _decrypt_stream_async(chunks, key, max_segment_size + TAG_LENGTH)
+
+
+async def _decrypt_stream_async(
+    chunks: AsyncIterable[bytes],
+    key: bytes,
+    max_record_length: int,
+) -> AsyncIterator[bytes]:
+    """Async generator behind ``decrypt_stream_async``."""
+    opener: Optional[_StreamOpener] = None
+    pending = bytearray()
+    
+    async for chunk in chunks:
+        pending += chunk
+        
+        if opener is None:
+            if len(pending) < STREAM_PREFIX_LENGTH:
+                continue
+            opener = _StreamOpener(key, bytes(pending[:STREAM_PREFIX_LENGTH]))
+            del pending[:STREAM_PREFIX_LENGTH]
+        
+        record = _split_record(pending, max_record_length)
+        while record is not None and record[1] < len(pending):
+            del pending[:record[1]]
+            yield await asyncio.to_thread(opener.open, record[0], False)
+            record = _split_record(pending, max_record_length)
+    
+    record = None
+    if opener is not None:
+        record = _split_record(pending, max_record_length)
+    if record is None or record[1] != len(pending):
+        raise ValueError("Encrypted stream is truncated or malformed")
+    
+    yield await asyncio.to_thread(opener.open, record[0], True)
+
+
+class CryptoActorPool:
+    """
+    Worker pool that encrypts queued chunks in batches.
     
-    aesgcm = AESGCM(key)
-    return aesgcm.decrypt(iv, ciphertext, None)
+    Each worker drains up to ``batch_size`` pending chunks at a time and
+    encrypts them back to back with the cached cipher for their key.
+    AES-GCM releases the GIL inside OpenSSL, so workers run in parallel
+    up to the memory-bandwidth limit. Output matches ``encrypt_data``.
+    
+    The queue hand-off costs more than it saves for small chunks and on
+    few cores; ``encrypt_many`` is faster there.
+    
+    Example:
+        >>> with CryptoActorPool() as pool:
+        ...     encrypted = pool.encrypt_many(chunks, key)
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, batch_size: int = 64):
+        """
+        Start the pool.
+        
+        Args:
+            max_workers: Number of worker threads (defaults to the CPU count)
+            batch_size: Maximum number of chunks a worker takes at once
+        """
+        workers = max_workers or os.cpu_count() or 1
+        self._batch_size = batch_size
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        # Daemon threads, so a pool that is never closed can't block exit
+        self._threads = [
+            threading.Thread(target=self._run, name=f"helix-crypto-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def _run(self) -> None:
+        """Worker loop: take a batch off the queue and encrypt it."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            
+            batch = [item]
+            stop = False
+            while len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            
+            for data, key, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(encrypt_data(data, key))
+                except Exception as e:
+                    future.set_exception(e)
+            
+            if stop:
+                return
+    
+    def submit(self, data: bytes, key: bytes) -> Future:
+        """
+        Queue a chunk for encryption.
+        
+        Args:
+            data: Data to encrypt
+            key: 32-byte encryption key
+            
+        Returns:
+            Future resolving to IV + ciphertext + auth tag
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("CryptoActorPool is closed")
+            self._queue.put((data, key, future))
+        return future
+    
+    def encrypt_many(self, chunks: Iterable[bytes], key: bytes) -> list[bytes]:
+        """
+        Encrypt many chunks under one key.
+        
+        Args:
+            chunks: Data chunks to encrypt
+            key: 32-byte encryption key
+            
+        Returns:
+            Encrypted chunks, in input order
+        """
+        futures = [self.submit(chunk, key) for chunk in chunks]
+        return [future.result() for future in futures]
+    
+    def close(self) -> None:
+        """Finish queued work and stop the workers."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in self._threads:
+                self._queue.put(None)
+        
+        for thread in self._threads:
+            thread.join()
+    
+    def __enter__(self) -> CryptoActorPool:
+        return self
+    
+    def __exit__(self, *args: object) -> None:
+        self.close()
 
 
 def export_key(key: bytes) -> str:
     """Export a key to base64 string."""
-    return base64.b64encode(key).decode("utf-8")
+    return binascii.b2a_base64(key, newline=False).decode("ascii")
 
 
 def import_key(key_string: str) -> bytes:
     """Import a key from base64 string."""
-    key = base64.b64decode(key_string)
+    key = binascii.a2b_base64(key_string)
     if len(key) != KEY_LENGTH:
         raise ValueError(f"Invalid key length: expected {KEY_LENGTH} bytes")
     return key
 
 
+# Derived keys cached per process (opt-in), keyed by a salted hash of the password
+_DERIVED_KEY_CACHE_SIZE = 16
+_derived_keys: OrderedDict[tuple, bytearray] = OrderedDict()
+_derived_keys_lock = threading.Lock()
+
+
+@atexit.register
+def clear_derived_key_cache() -> None:
+    """Zero and drop all cached password-derived keys."""
+    with _derived_keys_lock:
+        for key in _derived_keys.values():
+            _zeroize(key)
+        _derived_keys.clear()
+
+
 def derive_key_from_password(
     password: str,
     salt: bytes,
-    iterations: int = 100000,
+    iterations: int = PBKDF2_ITERATIONS,
+    *,
+    legacy_pbkdf2: bool = True,
+    time_cost: int = ARGON2_TIME_COST,
+    memory_cost: int = ARGON2_MEMORY_COST,
+    parallelism: int = ARGON2_PARALLELISM,
+    cache: bool = False,
 ) -> bytes:
     """
-    Derive an encryption key from a password using PBKDF2.
+    Derive an encryption key from a password.
+    
+    By default this uses PBKDF2-HMAC-SHA256, matching the TypeScript SDK
+    and keys derived by earlier versions. Pass ``legacy_pbkdf2=False`` to
+    use memory-hard Argon2id instead, which is far more expensive to
+    brute-force on GPUs. New data should prefer ``generate_salt_envelope``
+    and ``derive_key_from_envelope``, which record the KDF used.
+    
+    With ``cache=True`` the derived key is kept in process memory for
+    repeat calls with the same password and salt. The cache is looked up
+    by a fast salted hash of the password, so anyone able to read process
+    memory gets a cheap offline oracle for the password; only enable it
+    when that is acceptable. ``clear_derived_key_cache`` empties it.
     
     Args:
         password: User password
         salt: Random salt (should be stored with encrypted data)
         iterations: Number of PBKDF2 iterations
+        legacy_pbkdf2: Use PBKDF2 instead of Argon2id
+        time_cost: Argon2id passes
+        memory_cost: Argon2id memory in KiB
+        parallelism: Argon2id lanes
+        cache: Reuse and remember the key in the process-wide cache
         
     Returns:
         32-byte derived key
     """
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    secret = password.encode("utf-8")
+    if not cache:
+        return _derive_key(
+            secret, salt, iterations, legacy_pbkdf2, time_cost, memory_cost, parallelism
+        )
     
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=KEY_LENGTH,
-        salt=salt,
-        iterations=iterations,
+    # The raw password never becomes part of the cache key
+    password_hash = hashlib.blake2b(secret, key=salt[:64], digest_size=32).digest()
+    if legacy_pbkdf2:
+        cache_key = (KDF_PBKDF2_SHA256, password_hash, bytes(salt), iterations)
+    else:
+        cache_key = (
+            KDF_ARGON2ID, password_hash, bytes(salt), time_cost, memory_cost, parallelism
+        )
+    
+    with _derived_keys_lock:
+        cached = _derived_keys.get(cache_key)
+        if cached is not None:
+            _derived_keys.move_to_end(cache_key)
+            return bytes(cached)
+    
+    key = _derive_key(
+        secret, salt, iterations, legacy_pbkdf2, time_cost, memory_cost, parallelism
     )
     
-    return kdf.derive(password.encode("utf-8"))
+    with _derived_keys_lock:
+        _derived_keys[cache_key] = bytearray(key)
+        if len(_derived_keys) > _DERIVED_KEY_CACHE_SIZE:
+            _zeroize(_derived_keys.popitem(last=False)[1])
+    
+    return key
+
+
+def _derive_key(
+    secret: bytes,
+    salt: bytes,
+    iterations: int,
+    legacy_pbkdf2: bool,
+    time_cost: int,
+    memory_cost: int,
+    parallelism: int,
+) -> bytes:
+    """Run the selected KDF without caching."""
+    if not legacy_pbkdf2:
+        return hash_secret_raw(
+            secret=secret,
+            salt=salt,
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            hash_len=KEY_LENGTH,
+            type=Type.ID,
+        )
+    
+    return hashlib.pbkdf2_hmac("sha256", secret, salt, iterations, KEY_LENGTH)
 
 
 def generate_salt(length: int = 16) -> bytes:
@@ -244,57 +1253,190 @@ def generate_salt(length: int = 16) -> bytes:
     return os.urandom(length)
 
 
+def generate_salt_envelope(kdf: int = KDF_ARGON2ID, length: int = 16) -> bytes:
+    """
+    Generate a random salt prefixed with a one-byte KDF tag.
+    
+    Store the envelope alongside the encrypted data and pass it to
+    ``derive_key_from_envelope`` to derive the key with the same KDF.
+    
+    Args:
+        kdf: KDF tag (KDF_ARGON2ID or KDF_PBKDF2_SHA256)
+        length: Salt length in bytes
+        
+    Returns:
+        KDF tag + salt
+    """
+    if kdf not in (KDF_PBKDF2_SHA256, KDF_ARGON2ID):
+        raise ValueError(f"Unknown KDF tag: {kdf:#04x}")
+    return bytes((kdf,)) + generate_salt(length)
+
+
+def derive_key_from_envelope(
+    password: str,
+    envelope: bytes,
+    cache: bool = False,
+) -> bytes:
+    """
+    Derive a key using the KDF recorded in a salt envelope.
+    
+    Args:
+        password: User password
+        envelope: KDF tag + salt from ``generate_salt_envelope``
+        cache: Reuse and remember the key (see ``derive_key_from_password``)
+        
+    Returns:
+        32-byte derived key
+    """
+    if len(envelope) < 2:
+        raise ValueError("Salt envelope too short")
+    
+    kdf, salt = envelope[0], envelope[1:]
+    if kdf == KDF_ARGON2ID:
+        return derive_key_from_password(password, salt, legacy_pbkdf2=False, cache=cache)
+    if kdf == KDF_PBKDF2_SHA256:
+        return derive_key_from_password(password, salt, cache=cache)
+    raise ValueError(f"Unknown KDF tag: {kdf:#04x}")
+
+
+def compare_keys(a: bytes, b: bytes) -> bool:
+    """Compare two keys in constant time."""
+    return hmac.compare_digest(a, b)
+
+
+def _zeroize(buf: bytearray) -> None:
+    """Overwrite a key buffer with zeros in place."""
+    buf[:] = bytes(len(buf))
+
+
 class KeyStorage:
     """
     Simple key storage for managing encryption keys.
     
-    Keys are stored in memory with optional file backup.
+    Keys are stored in memory with optional file backup. Each key is
+    copied into a mutable buffer owned by the storage, which is zeroed
+    when the key is deleted or replaced and recycled for later keys.
+    Deleting a key also drops the module's cached ciphers for it.
+    
+    This does not scrub every copy of the key from memory: bytes
+    returned by ``get``, keys held by callers, a ``HelixEncryption``
+    instance's last-used cipher and freed-but-not-overwritten memory are
+    all out of the storage's reach.
     """
     
+    # Maximum number of zeroed key buffers kept for reuse
+    POOL_SIZE = 64
+    
     def __init__(self):
-        self._keys: dict[str, bytes] = {}
+        self._keys: dict[str, bytearray] = {}
+        self._pool: list[bytearray] = []
+    
+    def _put(self, transaction_id: str, key: bytes) -> None:
+        """Copy a key into a (pooled) buffer and store it."""
+        if len(key) == KEY_LENGTH and self._pool:
+            buf = self._pool.pop()
+            buf[:] = key
+        else:
+            buf = bytearray(key)
+        
+        old = self._keys.get(transaction_id)
+        self._keys[transaction_id] = buf
+        if old is not None:
+            self._release(old)
+    
+    def _release(self, buf: bytearray) -> None:
+        """Evict a key's cached ciphers, zero its buffer and pool it."""
+        _evict_cached_ciphers(buf)
+        _zeroize(buf)
+        if len(buf) == KEY_LENGTH and len(self._pool) < self.POOL_SIZE:
+            self._pool.append(buf)
     
     def store(self, transaction_id: str, key: bytes) -> None:
         """Store a key for a transaction."""
-        self._keys[transaction_id] = key
+        self._put(transaction_id, key)
     
     def get(self, transaction_id: str) -> bytes | None:
         """Get a stored key by transaction ID."""
-        return self._keys.get(transaction_id)
+        buf = self._keys.get(transaction_id)
+        return bytes(buf) if buf is not None else None
     
     def delete(self, transaction_id: str) -> bool:
-        """Delete a stored key."""
-        if transaction_id in self._keys:
-            del self._keys[transaction_id]
-            return True
-        return False
+        """Delete a stored key, zeroing its buffer."""
+        buf = self._keys.pop(transaction_id, None)
+        if buf is None:
+            return False
+        self._release(buf)
+        return True
+    
+    def clear(self) -> None:
+        """Delete all stored keys, zeroing their buffers."""
+        keys, self._keys = self._keys, {}
+        for buf in keys.values():
+            self._release(buf)
     
     def export_all(self) -> dict[str, str]:
         """Export all keys as base64 strings."""
+        b2a = binascii.b2a_base64
         return {
-            tx_id: export_key(key)
+            tx_id: b2a(key, newline=False).decode("ascii")
             for tx_id, key in self._keys.items()
         }
     
     def import_all(self, keys: dict[str, str]) -> None:
         """Import keys from base64 strings."""
+        a2b = binascii.a2b_base64
+        put = self._put
         for tx_id, key_b64 in keys.items():
-            self._keys[tx_id] = import_key(key_b64)
+            key = a2b(key_b64)
+            if len(key) != KEY_LENGTH:
+                raise ValueError(f"Invalid key length: expected {KEY_LENGTH} bytes")
+            put(tx_id, key)
     
-    def save_to_file(self, path: str) -> None:
-        """Save keys to a JSON file."""
-        import json
+    def save_to_file(self, path: str, format: str = "json") -> None:
+        """
+        Save keys to a file.
+        
+        Args:
+            path: Destination file path
+            format: "json" (base64 keys, readable by earlier versions) or
+                "msgpack" (raw key bytes, smaller and faster; requires
+                ``pip install helix-sdk[msgpack]``)
+        """
         from pathlib import Path
         
-        data = self.export_all()
-        Path(path).write_text(json.dumps(data, indent=2))
+        if format == "msgpack":
+            msgpack = _import_msgpack()
+            Path(path).write_bytes(msgpack.packb(self._keys, use_bin_type=True))
+        elif format == "json":
+            Path(path).write_bytes(json_dumps(self.export_all(), indent=True))
+        else:
+            raise ValueError(f"Unknown key file format: {format}")
     
     def load_from_file(self, path: str) -> None:
-        """Load keys from a JSON file."""
-        import json
+        """Load keys from a JSON or MessagePack file (detected automatically)."""
         from pathlib import Path
         
-        data = json.loads(Path(path).read_text())
-        self.import_all(data)
+        raw = Path(path).read_bytes()
+        
+        if raw.lstrip()[:1] == b"{":
+            self.import_all(json_loads(raw))
+            return
+        
+        msgpack = _import_msgpack()
+        for tx_id, key in msgpack.unpackb(raw, raw=False).items():
+            if len(key) != KEY_LENGTH:
+                raise ValueError(f"Invalid key length: expected {KEY_LENGTH} bytes")
+            self._put(tx_id, key)
+
+
+def _import_msgpack():
+    """Import msgpack, explaining how to install it if missing."""
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "msgpack key files require msgpack: pip install helix-sdk[msgpack]"
+        ) from e
+    return msgpack
 
 # Encryption utilities
@@ -32,14 +32,22 @@ setup(
     packages=find_packages(),
     python_requires=">=3.9",
     install_requires=[
-        "httpx>=0.25.0",
+        "httpx[http2]>=0.25.0",
         "solana>=0.30.0",
         "solders>=0.18.0",
-        "cryptography>=41.0.0",
+        "cryptography>=42.0.0",
+        "argon2-cffi>=21.3.0",
         "pynacl>=1.5.0",
         "aiofiles>=23.0.0",
     ],
     extras_require={
+        "fast": [
+            "cryptography>=43.0.0",
+            "orjson>=3.9.0",
+        ],
+        "msgpack": [
+            "msgpack>=1.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
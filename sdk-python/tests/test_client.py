@@ -0,0 +1,25 @@
+"""Tests for HelixClient helpers."""
+
+from pathlib import Path
+
+import pytest
+
+from helix_sdk.client import HelixClient
+
+
+@pytest.mark.parametrize(
+    "name, mime_type",
+    [
+        ("app.js", "application/javascript"),
+        ("PHOTO.JPG", "image/jpeg"),
+        ("notes.txt", "text/plain"),
+        ("report.docx", (
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        )),
+        ("archive.tar.gz", "application/octet-stream"),
+        ("data.unknownext", "application/octet-stream"),
+        ("README", "application/octet-stream"),
+    ],
+)
+def test_guess_mime_type(name, mime_type):
+    assert HelixClient._guess_mime_type(None, Path(name)) == mime_type
@@ -0,0 +1,81 @@
+"""Tests for one-shot encryption helpers."""
+
+import os
+
+import pytest
+
+import helix_sdk.encryption as encryption
+from helix_sdk.encryption import (
+    StreamingDecryptor,
+    decrypt_data,
+    encrypt_into,
+    encrypted_size,
+    generate_key,
+)
+
+
+SIZES = [0, 1, 15, 16, 17, 100_000]
+
+
+class _WithoutEncryptInto:
+    """AESGCM stand-in for cryptography releases without encrypt_into."""
+
+    def __init__(self, aesgcm):
+        self.encrypt = aesgcm.encrypt
+        self.decrypt = aesgcm.decrypt
+
+
+@pytest.fixture(params=["encrypt_into", "update_into"])
+def cipher_path(request, monkeypatch):
+    """Run a test against both encrypt_into code paths."""
+    if request.param == "update_into":
+        get_aesgcm = encryption._get_aesgcm
+        monkeypatch.setattr(
+            encryption, "_get_aesgcm", lambda key: _WithoutEncryptInto(get_aesgcm(key))
+        )
+    return request.param
+
+
+def _stream_decrypt(encrypted: bytes, key: bytes) -> bytes:
+    decryptor = StreamingDecryptor(key)
+    plaintext = decryptor.update(encrypted)
+    return plaintext + decryptor.finalize()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_encrypt_into_bytearray(cipher_path, size):
+    key = generate_key()
+    data = os.urandom(size)
+    out = bytearray(encrypted_size(size))
+
+    assert encrypt_into(data, key, out) == len(out)
+    assert decrypt_data(bytes(out), key) == data
+    assert _stream_decrypt(bytes(out), key) == data
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_encrypt_into_oversized_memoryview(cipher_path, size):
+    key = generate_key()
+    data = os.urandom(size)
+    backing = bytearray(b"\xaa" * (encrypted_size(size) + 32))
+
+    written = encrypt_into(data, key, memoryview(backing))
+
+    assert written == encrypted_size(size)
+    assert backing[written:] == b"\xaa" * 32
+    assert decrypt_data(bytes(backing[:written]), key) == data
+    assert _stream_decrypt(bytes(backing[:written]), key) == data
+
+
+@pytest.mark.parametrize("size", [0, 17])
+def test_encrypt_into_undersized_buffer_is_rejected(size):
+    out = bytearray(encrypted_size(size) - 1)
+
+    with pytest.raises(ValueError):
+        encrypt_into(os.urandom(size), generate_key(), out)
+    assert out == bytes(len(out))
+
+
+def test_encrypt_into_invalid_key_is_rejected():
+    with pytest.raises(ValueError):
+        encrypt_into(b"data", b"short", bytearray(encrypted_size(4)))
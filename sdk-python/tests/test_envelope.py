@@ -0,0 +1,120 @@
+"""Tests for the versioned envelope format and its untagged fallback."""
+
+import os
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from helix_sdk.encryption import (
+    ALG_AES_256_GCM,
+    ALG_AES_256_GCM_SIV,
+    ALG_CHACHA20_POLY1305,
+    ENVELOPE_HEADER_LENGTH,
+    ENVELOPE_VERSION,
+    IV_LENGTH,
+    TAG_LENGTH,
+    HelixEncryption,
+    _encrypt_tagged,
+    decrypt_data,
+    encrypt_data,
+    generate_key,
+)
+
+
+@pytest.mark.parametrize(
+    "algorithm", [ALG_AES_256_GCM, ALG_CHACHA20_POLY1305, ALG_AES_256_GCM_SIV]
+)
+def test_round_trip_per_algorithm(algorithm):
+    key = generate_key()
+    data = os.urandom(100)
+    envelope = _encrypt_tagged(algorithm, data, key)
+
+    assert envelope[0] == ENVELOPE_VERSION
+    assert envelope[1] == algorithm
+    assert len(envelope) == ENVELOPE_HEADER_LENGTH + IV_LENGTH + len(data) + TAG_LENGTH
+    assert decrypt_data(envelope, key, compat=False) == data
+
+
+def test_encrypt_data_writes_header():
+    key = generate_key()
+    envelope = encrypt_data(b"secret", key, compat=False)
+
+    assert isinstance(envelope, bytes)
+    assert envelope[0] == ENVELOPE_VERSION
+    assert envelope[1] in (ALG_AES_256_GCM, ALG_CHACHA20_POLY1305)
+    assert decrypt_data(envelope, key, compat=False) == b"secret"
+
+
+def test_gcm_siv_helix_encryption_round_trip():
+    key = generate_key()
+    enc = HelixEncryption(algorithm="aes-gcm-siv")
+    envelope = enc.encrypt(b"secret", key)
+
+    assert envelope[:2] == bytes((ENVELOPE_VERSION, ALG_AES_256_GCM_SIV))
+    assert enc.decrypt(envelope, key) == b"secret"
+
+
+def test_unknown_helix_encryption_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        HelixEncryption(algorithm="des")
+
+
+def test_legacy_untagged_data_is_accepted():
+    key = generate_key()
+    legacy = encrypt_data(b"legacy", key)
+
+    assert decrypt_data(legacy, key, compat=False) == b"legacy"
+    assert HelixEncryption(algorithm="aes-gcm-siv").decrypt(legacy, key) == b"legacy"
+
+
+def test_legacy_data_whose_iv_looks_like_a_header_is_accepted():
+    key = generate_key()
+    iv = bytes((ENVELOPE_VERSION, ALG_AES_256_GCM_SIV)) + os.urandom(IV_LENGTH - 2)
+    legacy = iv + AESGCM(key).encrypt(iv, b"legacy", None)
+
+    assert decrypt_data(legacy, key, compat=False) == b"legacy"
+
+
+def test_tampered_envelope_is_rejected():
+    key = generate_key()
+    envelope = bytearray(encrypt_data(b"secret", key, compat=False))
+    envelope[-1] ^= 1
+
+    with pytest.raises(InvalidTag):
+        decrypt_data(bytes(envelope), key, compat=False)
+
+
+def test_tampered_algorithm_tag_is_rejected():
+    key = generate_key()
+    envelope = bytearray(_encrypt_tagged(ALG_AES_256_GCM, b"secret", key))
+    envelope[1] = ALG_AES_256_GCM_SIV
+
+    with pytest.raises(InvalidTag):
+        decrypt_data(bytes(envelope), key, compat=False)
+
+
+def test_wrong_key_is_rejected():
+    envelope = encrypt_data(b"secret", generate_key(), compat=False)
+
+    with pytest.raises(InvalidTag):
+        decrypt_data(envelope, generate_key(), compat=False)
+
+
+def test_truncated_envelope_is_rejected():
+    key = generate_key()
+    envelope = encrypt_data(b"secret", key, compat=False)
+
+    with pytest.raises((ValueError, InvalidTag)):
+        decrypt_data(envelope[:-1], key, compat=False)
+    with pytest.raises(ValueError):
+        decrypt_data(envelope[:ENVELOPE_HEADER_LENGTH + 4], key, compat=False)
+
+
+def test_compat_format_is_unchanged():
+    key = generate_key()
+    encrypted = encrypt_data(b"secret", key)
+
+    assert len(encrypted) == IV_LENGTH + len(b"secret") + TAG_LENGTH
+    iv, ciphertext = encrypted[:IV_LENGTH], encrypted[IV_LENGTH:]
+    assert AESGCM(key).decrypt(iv, ciphertext, None) == b"secret"
@@ -0,0 +1,87 @@
+"""Tests for KeyStorage file persistence."""
+
+import pytest
+
+from helix_sdk.encryption import KEY_LENGTH, KeyStorage, generate_key
+
+
+def _storage(count: int) -> KeyStorage:
+    storage = KeyStorage()
+    for i in range(count):
+        storage.store(f"tx-{i}", generate_key())
+    return storage
+
+
+@pytest.mark.parametrize("format", ["json", "msgpack"])
+@pytest.mark.parametrize("count", [1, 50])
+def test_round_trip(tmp_path, format, count):
+    if format == "msgpack":
+        pytest.importorskip("msgpack")
+    path = tmp_path / "keys"
+    storage = _storage(count)
+    storage.save_to_file(str(path), format=format)
+
+    loaded = KeyStorage()
+    loaded.load_from_file(str(path))
+
+    assert loaded.export_all() == storage.export_all()
+    assert isinstance(loaded.get("tx-0"), bytes)
+
+
+def test_empty_json_round_trip(tmp_path):
+    path = tmp_path / "keys.json"
+    KeyStorage().save_to_file(str(path))
+
+    assert path.read_bytes().strip() == b"{}"
+    loaded = KeyStorage()
+    loaded.load_from_file(str(path))
+    assert loaded.export_all() == {}
+
+
+def test_empty_msgpack_round_trip(tmp_path):
+    pytest.importorskip("msgpack")
+    path = tmp_path / "keys.msgpack"
+    KeyStorage().save_to_file(str(path), format="msgpack")
+
+    assert path.read_bytes() == b"\x80"
+    loaded = KeyStorage()
+    loaded.load_from_file(str(path))
+    assert loaded.export_all() == {}
+
+
+def test_json_is_readable_by_earlier_versions(tmp_path):
+    import base64
+    import json
+
+    path = tmp_path / "keys.json"
+    storage = _storage(3)
+    storage.save_to_file(str(path))
+
+    data = json.loads(path.read_text())
+    assert {k: base64.b64decode(v) for k, v in data.items()} == {
+        f"tx-{i}": storage.get(f"tx-{i}") for i in range(3)
+    }
+
+
+def test_msgpack_bad_key_length_is_rejected(tmp_path):
+    msgpack = pytest.importorskip("msgpack")
+
+    path = tmp_path / "keys.msgpack"
+    short_key = b"\x00" * (KEY_LENGTH - 1)
+    path.write_bytes(msgpack.packb({"tx": short_key}, use_bin_type=True))
+
+    with pytest.raises(ValueError):
+        KeyStorage().load_from_file(str(path))
+
+
+def test_json_bad_key_length_is_rejected(tmp_path):
+    path = tmp_path / "keys.json"
+    path.write_text('{"tx": "AAAA"}')
+
+    with pytest.raises(ValueError):
+        KeyStorage().load_from_file(str(path))
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        _storage(1).save_to_file(str(tmp_path / "keys"), format="yaml")
@@ -0,0 +1,188 @@
+"""Tests for the segmented encrypt_stream/decrypt_stream format."""
+
+import asyncio
+import os
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from helix_sdk.encryption import (
+    STREAM_PREFIX_LENGTH,
+    decrypt_stream,
+    decrypt_stream_async,
+    encrypt_stream,
+    encrypt_stream_async,
+    generate_key,
+)
+
+
+SEGMENT_SIZE = 64
+
+
+def _records(stream: bytes) -> tuple[bytes, list[bytes]]:
+    """Split an encrypted stream into its prefix and raw records."""
+    prefix, rest = stream[:STREAM_PREFIX_LENGTH], stream[STREAM_PREFIX_LENGTH:]
+    records = []
+    while rest:
+        end = 4 + int.from_bytes(rest[:4], "big")
+        records.append(rest[:end])
+        rest = rest[end:]
+    return prefix, records
+
+
+def _encrypt(data: bytes, key: bytes) -> bytes:
+    return b"".join(encrypt_stream([data], key, segment_size=SEGMENT_SIZE))
+
+
+def _decrypt(stream: bytes, key: bytes) -> bytes:
+    return b"".join(decrypt_stream([stream], key))
+
+
+@pytest.mark.parametrize(
+    "size", [0, 1, SEGMENT_SIZE - 1, SEGMENT_SIZE, SEGMENT_SIZE + 1, 1000]
+)
+def test_round_trip(size):
+    key = generate_key()
+    data = os.urandom(size)
+    assert _decrypt(_encrypt(data, key), key) == data
+
+
+def test_round_trip_with_arbitrary_chunking():
+    key = generate_key()
+    data = os.urandom(1000)
+    chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+    stream = b"".join(encrypt_stream(chunks, key, segment_size=SEGMENT_SIZE))
+
+    pieces = [stream[i:i + 13] for i in range(0, len(stream), 13)]
+    assert b"".join(decrypt_stream(pieces, key)) == data
+
+
+def test_async_round_trip():
+    key = generate_key()
+    data = os.urandom(1000)
+
+    async def aiter(items):
+        for item in items:
+            yield item
+
+    async def run():
+        encrypted = encrypt_stream_async(aiter([data]), key, SEGMENT_SIZE)
+        stream = [chunk async for chunk in encrypted]
+        decrypted = decrypt_stream_async(aiter(stream), key)
+        return b"".join([chunk async for chunk in decrypted])
+
+    assert asyncio.run(run()) == data
+
+
+def test_truncated_at_record_boundary_is_rejected():
+    key = generate_key()
+    prefix, records = _records(_encrypt(os.urandom(1000), key))
+
+    with pytest.raises(InvalidTag):
+        _decrypt(prefix + b"".join(records[:-1]), key)
+
+
+def test_truncated_mid_record_is_rejected():
+    key = generate_key()
+    stream = _encrypt(os.urandom(1000), key)
+
+    with pytest.raises(ValueError):
+        _decrypt(stream[:-5], key)
+
+
+def test_oversized_record_length_is_rejected_early():
+    key = generate_key()
+    prefix, _ = _records(_encrypt(os.urandom(100), key))
+    forged = prefix + (0xFFFFFFF0).to_bytes(4, "big")
+    consumed = []
+
+    def chunks():
+        yield forged
+        for _ in range(1000):
+            consumed.append(1)
+            yield b"\x00" * 4096
+
+    with pytest.raises(ValueError):
+        list(decrypt_stream(chunks(), key))
+    assert not consumed
+
+
+def test_max_segment_size_allows_larger_segments():
+    key = generate_key()
+    data = os.urandom(1000)
+    stream = b"".join(encrypt_stream([data], key, segment_size=500))
+
+    with pytest.raises(ValueError):
+        list(decrypt_stream([stream], key, max_segment_size=499))
+    assert b"".join(decrypt_stream([stream], key, max_segment_size=500)) == data
+
+
+def test_oversized_record_length_is_rejected_early_async():
+    key = generate_key()
+    prefix, _ = _records(_encrypt(os.urandom(100), key))
+    forged = prefix + (0xFFFFFFF0).to_bytes(4, "big")
+
+    async def chunks():
+        yield forged
+        yield b"\x00" * 4096
+
+    async def run():
+        return [chunk async for chunk in decrypt_stream_async(chunks(), key)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+
+def test_missing_prefix_is_rejected():
+    with pytest.raises(ValueError):
+        _decrypt(b"\x00" * (STREAM_PREFIX_LENGTH - 1), generate_key())
+
+
+def test_reordered_records_are_rejected():
+    key = generate_key()
+    prefix, records = _records(_encrypt(os.urandom(1000), key))
+    records[0], records[1] = records[1], records[0]
+
+    with pytest.raises(InvalidTag):
+        _decrypt(prefix + b"".join(records), key)
+
+
+def test_tampered_record_is_rejected():
+    key = generate_key()
+    stream = bytearray(_encrypt(os.urandom(1000), key))
+    stream[STREAM_PREFIX_LENGTH + 10] ^= 1
+
+    with pytest.raises(InvalidTag):
+        _decrypt(bytes(stream), key)
+
+
+def test_trailing_data_is_rejected():
+    key = generate_key()
+    stream = _encrypt(os.urandom(100), key)
+
+    with pytest.raises((ValueError, InvalidTag)):
+        _decrypt(stream + b"\x00", key)
+
+
+def test_wrong_key_is_rejected():
+    stream = _encrypt(os.urandom(100), generate_key())
+
+    with pytest.raises(InvalidTag):
+        _decrypt(stream, generate_key())
+
+
+@pytest.mark.parametrize("segment_size", [0, -1])
+def test_invalid_segment_size_is_rejected_eagerly(segment_size):
+    with pytest.raises(ValueError):
+        encrypt_stream([b"data"], generate_key(), segment_size=segment_size)
+    with pytest.raises(ValueError):
+        encrypt_stream_async(None, generate_key(), segment_size=segment_size)
+    with pytest.raises(ValueError):
+        decrypt_stream([b"data"], generate_key(), max_segment_size=segment_size)
+
+
+def test_invalid_key_is_rejected_eagerly():
+    with pytest.raises(ValueError):
+        encrypt_stream([b"data"], b"short")
+    with pytest.raises(ValueError):
+        decrypt_stream([b"data"], b"short")
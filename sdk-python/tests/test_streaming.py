@@ -0,0 +1,118 @@
+"""Tests for StreamingEncryptor and StreamingDecryptor."""
+
+import os
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from helix_sdk.encryption import (
+    IV_LENGTH,
+    TAG_LENGTH,
+    HelixEncryption,
+    StreamingDecryptor,
+    StreamingEncryptor,
+    decrypt_data,
+    encrypt_data,
+    encrypted_size,
+    generate_key,
+)
+
+
+SIZES = [0, 1, TAG_LENGTH - 1, TAG_LENGTH, TAG_LENGTH + 1, 1000]
+CHUNK_SIZES = [1, 5, IV_LENGTH, TAG_LENGTH, TAG_LENGTH + 1, 64, 4096]
+
+
+def _split(data: bytes, size: int) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _stream_encrypt(data: bytes, key: bytes, chunk_size: int) -> bytes:
+    encryptor = StreamingEncryptor(key)
+    parts = [encryptor.iv]
+    parts.extend(encryptor.update(chunk) for chunk in _split(data, chunk_size))
+    parts.append(encryptor.finalize())
+    return b"".join(parts)
+
+
+def _stream_decrypt(encrypted: bytes, key: bytes, chunk_size: int) -> bytes:
+    decryptor = StreamingDecryptor(key)
+    parts = [decryptor.update(chunk) for chunk in _split(encrypted, chunk_size)]
+    parts.append(decryptor.finalize())
+    return b"".join(parts)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_round_trip(size, chunk_size):
+    key = generate_key()
+    data = os.urandom(size)
+    encrypted = _stream_encrypt(data, key, chunk_size)
+
+    assert len(encrypted) == encrypted_size(size)
+    assert _stream_decrypt(encrypted, key, chunk_size) == data
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_compatible_with_one_shot_format(chunk_size):
+    key = generate_key()
+    data = os.urandom(1000)
+
+    assert decrypt_data(_stream_encrypt(data, key, chunk_size), key) == data
+    assert _stream_decrypt(encrypt_data(data, key), key, chunk_size) == data
+    helix_encrypted = HelixEncryption().encrypt(data, key)
+    assert _stream_decrypt(helix_encrypted, key, chunk_size) == data
+
+
+def test_mixed_chunk_sizes():
+    key = generate_key()
+    data = os.urandom(1000)
+    encrypted = encrypt_data(data, key)
+
+    decryptor = StreamingDecryptor(key)
+    parts = []
+    offset = 0
+    for size in [3, 20, 1, 15, 400, 2, 16, 17]:
+        parts.append(decryptor.update(encrypted[offset:offset + size]))
+        offset += size
+    parts.append(decryptor.update(encrypted[offset:]))
+    parts.append(decryptor.finalize())
+
+    assert b"".join(parts) == data
+
+
+@pytest.mark.parametrize("position", [0, IV_LENGTH, -TAG_LENGTH, -1])
+def test_tampered_data_is_rejected(position):
+    key = generate_key()
+    encrypted = bytearray(encrypt_data(os.urandom(100), key))
+    encrypted[position] ^= 1
+
+    with pytest.raises(InvalidTag):
+        _stream_decrypt(bytes(encrypted), key, 7)
+
+
+def test_truncated_data_is_rejected():
+    key = generate_key()
+    encrypted = encrypt_data(os.urandom(100), key)
+
+    with pytest.raises(InvalidTag):
+        _stream_decrypt(encrypted[:-1], key, 7)
+
+
+@pytest.mark.parametrize("size", [0, IV_LENGTH, IV_LENGTH + TAG_LENGTH - 1])
+def test_too_short_data_is_rejected(size):
+    with pytest.raises(ValueError):
+        _stream_decrypt(os.urandom(size), generate_key(), 5)
+
+
+def test_wrong_key_is_rejected():
+    encrypted = encrypt_data(b"secret", generate_key())
+
+    with pytest.raises(InvalidTag):
+        _stream_decrypt(encrypted, generate_key(), 5)
+
+
+def test_invalid_key_is_rejected():
+    with pytest.raises(ValueError):
+        StreamingEncryptor(b"short")
+    with pytest.raises(ValueError):
+        StreamingDecryptor(b"short")